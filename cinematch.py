@@ -1,13 +1,39 @@
 import streamlit as st
 import pandas as pd
 import requests
-from fuzzywuzzy import fuzz, process
+import requests_cache
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor
+from rapidfuzz import fuzz, process
 import google.generativeai as genai
 from datetime import datetime
-import json
+import orjson
+import threading
 import time
 import os
 
+TMDB_BASE_URL = "https://api.themoviedb.org/3"
+
+# Shared HTTP session so TMDB calls reuse keep-alive connections.
+# The on-disk cache (tmdb_cache.sqlite, 1 week TTL) persists across restarts.
+# Volatile endpoints get short expiries so discover/search results stay fresh,
+# and poster bytes skip the sqlite layer since st.cache_data already holds them.
+# Retries cover transient rate-limit and server errors with backoff.
+tmdb_session = requests_cache.CachedSession(
+    'tmdb_cache',
+    expire_after=604800,
+    urls_expire_after={
+        'api.themoviedb.org/3/discover/*': 600,
+        'api.themoviedb.org/3/search/*': 3600,
+        'image.tmdb.org/*': requests_cache.DO_NOT_CACHE,
+    },
+)
+tmdb_session.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
 # Page configuration
 st.set_page_config(
     page_title="Cinematch",
@@ -21,40 +47,69 @@ def load_favorites():
     """Load favorites from local storage file"""
     try:
         if os.path.exists('favorites.json'):
-            with open('favorites.json', 'r') as f:
-                return json.load(f)
+            with open('favorites.json', 'rb') as f:
+                return orjson.loads(f.read())
     except:
         pass
     return []
 
-def save_favorites():
-    """Save favorites to local storage file"""
+# Debounced background persistence so click handlers don't block on disk I/O
+_save_timers = {}
+_save_lock = threading.Lock()
+
+def _write_json_atomic(file_name, data):
+    """Write JSON to a tempfile and atomically swap it into place"""
     try:
-        with open('favorites.json', 'w') as f:
-            json.dump(st.session_state.favorites, f)
+        tmp_name = f"{file_name}.tmp"
+        with open(tmp_name, 'wb') as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp_name, file_name)
     except:
         pass
 
+def _schedule_save(file_name, data, delay=0.5):
+    """Coalesce rapid saves into one background write shortly after the last one"""
+    with _save_lock:
+        timer = _save_timers.get(file_name)
+        if timer is not None:
+            timer.cancel()
+        timer = threading.Timer(delay, _write_json_atomic, args=(file_name, data))
+        timer.daemon = True
+        _save_timers[file_name] = timer
+        timer.start()
+
+def save_favorites():
+    """Save favorites to local storage file (debounced, off the click path)"""
+    _schedule_save('favorites.json', list(st.session_state.favorites))
+
 def load_user_ratings():
     """Load user ratings from local storage file"""
     try:
         if os.path.exists('user_ratings.json'):
-            with open('user_ratings.json', 'r') as f:
-                return json.load(f)
+            with open('user_ratings.json', 'rb') as f:
+                return orjson.loads(f.read())
     except:
         pass
     return {}
 
 def save_user_ratings():
-    """Save user ratings to local storage file"""
-    try:
-        with open('user_ratings.json', 'w') as f:
-            json.dump(st.session_state.user_ratings, f)
-    except:
-        pass
+    """Save user ratings to local storage file (debounced, off the click path)"""
+    _schedule_save('user_ratings.json', dict(st.session_state.user_ratings))
 
-def load_css(file_name):
-    """Load CSS from external file"""
+def set_recommendations(recommendations, min_rating=0.0):
+    """Store recommendations along with a DataFrame view for vectorized filtering
+
+    min_rating records the threshold already applied upstream (e.g. server-side
+    via vote_average.gte) so the display mask only re-runs for stricter values.
+    """
+    st.session_state.recommendations = recommendations
+    st.session_state.rec_df = pd.DataFrame(recommendations)
+    st.session_state.rec_min_rating = min_rating
+    st.session_state.card_window = 10
+
+@st.cache_data
+def load_css(file_name, mtime=None):
+    """Load CSS from external file (cached; mtime in the key busts it on edits)"""
     try:
         with open(file_name, 'r') as f:
             return f.read()
@@ -64,14 +119,95 @@ def load_css(file_name):
 
 def get_theme_css():
     """Get CSS based on current theme"""
-    if st.session_state.dark_mode:
-        return load_css('styles_dark.css')
-    else:
-        return load_css('styles_light.css')
+    file_name = 'styles_dark.css' if st.session_state.dark_mode else 'styles_light.css'
+    mtime = os.path.getmtime(file_name) if os.path.exists(file_name) else None
+    return load_css(file_name, mtime)
+
+# TMDB fetchers live at module level so st.cache_data can hash their arguments;
+# every Streamlit rerun then hits the in-memory cache instead of the network
+@st.cache_data(ttl=60 * 60 * 24, max_entries=5000)
+def fetch_search_results(api_key, query):
+    """Fetch movie search results from TMDB (cached for a day)"""
+    url = f"{TMDB_BASE_URL}/search/movie"
+    params = {
+        'api_key': api_key,
+        'query': query,
+        'language': 'en-US'
+    }
+    response = tmdb_session.get(url, params=params, timeout=5)
+    response.raise_for_status()
+    return orjson.loads(response.content).get('results', [])
+
+@st.cache_data(ttl=60 * 60 * 24, max_entries=5000)
+def fetch_movie_details(api_key, movie_id):
+    """Fetch detailed movie information from TMDB (cached for a day)"""
+    url = f"{TMDB_BASE_URL}/movie/{movie_id}"
+    params = {
+        'api_key': api_key,
+        'append_to_response': 'watch/providers,release_dates,videos'
+    }
+    response = tmdb_session.get(url, params=params, timeout=5)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+@st.cache_data(ttl=60 * 60 * 24, max_entries=5000)
+def fetch_movie_videos(api_key, movie_id):
+    """Fetch the videos list for a movie from TMDB (cached for a day)"""
+    url = f"{TMDB_BASE_URL}/movie/{movie_id}/videos"
+    params = {
+        'api_key': api_key,
+        'language': 'en-US'
+    }
+    response = tmdb_session.get(url, params=params, timeout=5)
+    response.raise_for_status()
+    return orjson.loads(response.content).get('results', [])
+
+@st.cache_data(ttl=60 * 60 * 24, max_entries=5000)
+def fetch_watch_providers(api_key, movie_id):
+    """Fetch watch providers for a movie from TMDB (cached for a day)"""
+    url = f"{TMDB_BASE_URL}/movie/{movie_id}/watch/providers"
+    params = {'api_key': api_key}
+    response = tmdb_session.get(url, params=params, timeout=5)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+@st.cache_data(ttl=60 * 60, max_entries=1000)
+def fetch_similar_movies(api_key, title):
+    """Fetch movies similar to a title from TMDB (cached for an hour)"""
+    search_results = fetch_search_results(api_key, title)
+    if not search_results:
+        return []
+
+    # Get similar movies for the first match
+    movie_id = search_results[0]['id']
+    url = f"{TMDB_BASE_URL}/movie/{movie_id}/similar"
+    params = {
+        'api_key': api_key,
+        'language': 'en-US'
+    }
+    response = tmdb_session.get(url, params=params, timeout=5)
+    response.raise_for_status()
+    return orjson.loads(response.content).get('results', [])
+
+@st.cache_data(ttl=60 * 60 * 24, max_entries=500)
+def fetch_poster(url):
+    """Fetch poster image bytes (cached so reruns don't re-download them)"""
+    try:
+        response = tmdb_session.get(url, timeout=5)
+        response.raise_for_status()
+        return response.content
+    except requests.RequestException:
+        return None
 
 # NOW Initialize session state (after functions are defined)
 if 'recommendations' not in st.session_state:
     st.session_state.recommendations = []
+if 'rec_df' not in st.session_state:
+    st.session_state.rec_df = pd.DataFrame()
+if 'rec_min_rating' not in st.session_state:
+    st.session_state.rec_min_rating = 0.0
+if 'card_window' not in st.session_state:
+    st.session_state.card_window = 10
 if 'favorites' not in st.session_state:
     st.session_state.favorites = load_favorites()
 if 'dark_mode' not in st.session_state:
@@ -83,7 +219,7 @@ class MovieRecommender:
     def __init__(self):
         self.tmdb_api_key = None
         self.gemini_api_key = None
-        self.base_url = "https://api.themoviedb.org/3"
+        self.base_url = TMDB_BASE_URL
         self.image_base_url = "https://image.tmdb.org/t/p/w500"
         
         # Genre mapping (TMDB genre IDs)
@@ -100,6 +236,32 @@ class MovieRecommender:
             'G': 'G', 'PG': 'PG', 'PG-13': 'PG-13', 'R': 'R', 'NC-17': 'NC-17'
         }
 
+        # Precomputed lookups for discover_movies so the hot path does one
+        # dict access per genre/rating instead of rebuilding mappings
+        self._genres_str = {name: str(genre_id) for name, genre_id in self.genres.items()}
+        self._cert_mapping = self.age_ratings
+
+        # Errors raised inside ThreadPoolExecutor workers, where st.error is a
+        # no-op; collected here and surfaced from the main script thread
+        self._errors = []
+        self._errors_lock = threading.Lock()
+
+    def _record_error(self, message):
+        """Record an error for later display (safe to call from worker threads)"""
+        with self._errors_lock:
+            self._errors.append(message)
+
+    def pop_errors(self):
+        """Return and clear the errors collected since the last call"""
+        with self._errors_lock:
+            errors, self._errors = self._errors, []
+        return errors
+
+    def show_errors(self):
+        """Display collected errors; call from the main script thread only"""
+        for message in self.pop_errors():
+            st.error(message)
+
     def setup_apis(self, tmdb_key, gemini_key=None):
         """Setup API keys"""
         self.tmdb_api_key = tmdb_key
@@ -111,39 +273,24 @@ class MovieRecommender:
         """Search for movies using TMDB API"""
         if not self.tmdb_api_key:
             return []
-        
-        url = f"{self.base_url}/search/movie"
-        params = {
-            'api_key': self.tmdb_api_key,
-            'query': query,
-            'language': 'en-US'
-        }
-        
+
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json().get('results', [])
+            return fetch_search_results(self.tmdb_api_key, query)
         except requests.RequestException as e:
-            st.error(f"Error searching movies: {e}")
+            # May run in a worker thread where st.error would be a no-op
+            self._record_error(f"Error searching movies: {e}")
             return []
-    
+
     def get_movie_details(self, movie_id):
         """Get detailed movie information"""
         if not self.tmdb_api_key:
             return None
-            
-        url = f"{self.base_url}/movie/{movie_id}"
-        params = {
-            'api_key': self.tmdb_api_key,
-            'append_to_response': 'watch/providers,release_dates,videos'
-        }
-        
+
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+            return fetch_movie_details(self.tmdb_api_key, movie_id)
         except requests.RequestException as e:
-            st.error(f"Error getting movie details: {e}")
+            # May run in a worker thread where st.error would be a no-op
+            self._record_error(f"Error getting movie details: {e}")
             return None
 
     def get_age_rating_from_details(self, movie_details):
@@ -159,38 +306,38 @@ class MovieRecommender:
                         return certification
         return 'Not Rated'
 
+    def extract_trailer_url(self, movie_details):
+        """Extract trailer URL from movie details (append_to_response=videos)"""
+        if not movie_details or 'videos' not in movie_details:
+            return None
+
+        # Short-circuit on the first YouTube trailer
+        video = next((v for v in movie_details['videos'].get('results', [])
+                      if v.get('site') == 'YouTube' and v.get('type') == 'Trailer'), None)
+        return f"https://www.youtube.com/embed/{video['key']}" if video else None
+
     def get_movie_trailer(self, movie_id):
-        """Get movie trailer URL"""
+        """Get movie trailer URL (fallback - prefer extract_trailer_url on details)"""
         if not self.tmdb_api_key:
             return None
-            
-        url = f"{self.base_url}/movie/{movie_id}/videos"
-        params = {
-            'api_key': self.tmdb_api_key,
-            'language': 'en-US'
-        }
-        
+
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            videos = response.json().get('results', [])
-            
-            # Find YouTube trailer
-            for video in videos:
-                if video.get('site') == 'YouTube' and video.get('type') == 'Trailer':
-                    return f"https://www.youtube.com/embed/{video['key']}"
-            
-            return None
+            videos = fetch_movie_videos(self.tmdb_api_key, movie_id)
+
+            # Short-circuit on the first YouTube trailer
+            video = next((v for v in videos
+                          if v.get('site') == 'YouTube' and v.get('type') == 'Trailer'), None)
+            return f"https://www.youtube.com/embed/{video['key']}" if video else None
         except requests.RequestException as e:
             return None
     #movie trailer funct ends
 
     # PART 2: Fixed discover_movies method with age rating filter
-    def discover_movies(self, genres=None, year=None, age_ratings=None, sort_by="popularity.desc", page=1):
+    def discover_movies(self, genres=None, year=None, age_ratings=None, sort_by="popularity.desc", page=1, min_rating=None):
         """Discover movies with filters"""
         if not self.tmdb_api_key:
             return []
-            
+
         url = f"{self.base_url}/discover/movie"
         params = {
             'api_key': self.tmdb_api_key,
@@ -198,47 +345,35 @@ class MovieRecommender:
             'page': page,
             'language': 'en-US'
         }
-        
+
+        # Push the rating predicate to TMDB instead of filtering client-side;
+        # vote_count.gte keeps obscure 10/10-rated films from dominating
+        if min_rating:
+            params['vote_average.gte'] = min_rating
+            params['vote_count.gte'] = 50
+
         if genres:
-            genre_ids = [str(self.genres[g]) for g in genres if g in self.genres]
+            genre_ids = [self._genres_str[g] for g in genres if g in self._genres_str]
             if genre_ids:
                 params['with_genres'] = ','.join(genre_ids)
-        
+
         if year and year != "Any":
             params['year'] = year
-        
+
         # Add age rating filter using certification
         if age_ratings:
             # Convert age ratings to TMDB certification format
-            cert_mapping = {
-                'G': 'G',
-                'PG': 'PG',
-                'PG-13': 'PG-13',
-                'R': 'R',
-                'NC-17': 'NC-17'
-            }
-            certifications = [cert_mapping.get(rating, rating) for rating in age_ratings]
+            certifications = [self._cert_mapping.get(rating, rating) for rating in age_ratings]
             if certifications:
                 params['certification_country'] = 'US'
                 params['certification'] = '|'.join(certifications)
                 
         try:
-            response = requests.get(url, params=params)
+            response = tmdb_session.get(url, params=params, timeout=5)
             response.raise_for_status()
-            results = response.json().get('results', [])
-            
-            # Additional client-side filtering for age ratings if API filter didn't work
-            if age_ratings and results:
-                filtered_results = []
-                for movie in results:
-                    movie_details = self.get_movie_details(movie['id'])
-                    if movie_details:
-                        movie_age_rating = self.get_age_rating_from_details(movie_details)
-                        if movie_age_rating in age_ratings or movie_age_rating == 'Not Rated':
-                            filtered_results.append(movie)
-                return filtered_results
-            
-            return results
+            # TMDB's certification filter is authoritative, so the results need
+            # no client-side re-check
+            return orjson.loads(response.content).get('results', [])
         except requests.RequestException as e:
             st.error(f"Error discovering movies: {e}")
             return []
@@ -246,25 +381,12 @@ class MovieRecommender:
     #find similar movies funct begins
     def find_similar_movies(self, movie_title):
         """Find movies similar to the input movie"""
-        # First, search for the movie
-        search_results = self.search_movies(movie_title)
-        if not search_results:
+        if not self.tmdb_api_key:
             return []
-        
-        # Get the first match
-        movie_id = search_results[0]['id']
-        
-        # Get similar movies
-        url = f"{self.base_url}/movie/{movie_id}/similar"
-        params = {
-            'api_key': self.tmdb_api_key,
-            'language': 'en-US'
-        }
-        
+
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json().get('results', [])
+            # Normalize the title so repeated searches share a cache entry
+            return fetch_similar_movies(self.tmdb_api_key, movie_title.strip().lower())
         except requests.RequestException as e:
             st.error(f"Error finding similar movies: {e}")
             return []
@@ -288,32 +410,48 @@ class MovieRecommender:
             response = model.generate_content(prompt)
             movie_titles = [title.strip() for title in response.text.split('\n') if title.strip()]
             
-            # Search for each recommended movie
-            recommendations = []
-            for title in movie_titles[:5]:  # Limit to 5 to avoid API limits
-                movies = self.search_movies(title)
-                if movies:
-                    recommendations.extend(movies[:1])  # Take first match
-            
+            # Search for each recommended movie concurrently (limit to 5 to avoid API limits)
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                search_results = list(executor.map(self.search_movies, movie_titles[:5]))
+            self.show_errors()
+
+            # Take first match from each search
+            recommendations = [movies[0] for movies in search_results if movies]
+
             return recommendations
             
         except Exception as e:
             st.error(f"Error with Gemini AI: {e}")
             return []
 
+    def extract_streaming_providers(self, movie_details):
+        """Extract streaming providers from movie details (append_to_response=watch/providers)"""
+        if not movie_details or 'watch/providers' not in movie_details:
+            return []
+
+        # Get US providers (you can modify for other countries)
+        us_providers = movie_details['watch/providers'].get('results', {}).get('US', {})
+        providers = []
+
+        for provider_type in ['flatrate', 'rent', 'buy']:
+            if provider_type in us_providers:
+                for provider in us_providers[provider_type]:
+                    providers.append({
+                        'name': provider['provider_name'],
+                        'type': provider_type,
+                        'logo': f"https://image.tmdb.org/t/p/w45{provider['logo_path']}"
+                    })
+
+        return providers
+
     def get_streaming_providers(self, movie_id):
-        """Get streaming providers for a movie"""
+        """Get streaming providers for a movie (fallback - prefer extract_streaming_providers)"""
         if not self.tmdb_api_key:
             return []
-            
-        url = f"{self.base_url}/movie/{movie_id}/watch/providers"
-        params = {'api_key': self.tmdb_api_key}
-        
+
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
+            data = fetch_watch_providers(self.tmdb_api_key, movie_id)
+
             # Get US providers (you can modify for other countries)
             us_providers = data.get('results', {}).get('US', {})
             providers = []
@@ -336,25 +474,18 @@ class MovieRecommender:
         """Format movie information for display"""
         poster_url = f"{self.image_base_url}{movie.get('poster_path', '')}" if movie.get('poster_path') else "https://via.placeholder.com/500x750?text=No+Poster"
         
-        # Get additional details
+        # Get additional details - one call covers providers and videos too,
+        # since get_movie_details already uses append_to_response
         movie_details = self.get_movie_details(movie['id'])
-        streaming_providers = self.get_streaming_providers(movie['id'])
-        trailer_url = self.get_movie_trailer(movie['id'])
+        streaming_providers = self.extract_streaming_providers(movie_details)
+        trailer_url = self.extract_trailer_url(movie_details)
         
         rating = movie.get('vote_average', 0)
         year = movie.get('release_date', '')[:4] if movie.get('release_date') else 'N/A'
         
         # Age rating from movie details
-        age_rating = 'Not Rated'
-        if movie_details and 'release_dates' in movie_details:
-            for country in movie_details['release_dates']['results']:
-                if country['iso_3166_1'] == 'US':
-                    for release in country['release_dates']:
-                        if release.get('certification'):
-                            age_rating = release['certification']
-                            break
-                    break
-        
+        age_rating = self.get_age_rating_from_details(movie_details)
+
         return {
             'title': movie.get('title', 'Unknown Title'),
             'poster_url': poster_url,
@@ -376,9 +507,9 @@ def display_star_rating(movie_id, context="default"):
     
     for i in range(1, 6):
         with rating_cols[i-1]:
-            # Add context to make keys unique across different sections
-            unique_key = f"star_{movie_id}_{i}_{context}_{hash(str(movie_id) + context) % 10000}"
-            if st.button("⭐" if i <= current_rating else "☆", 
+            # (movie_id, i, context) is already unique across sections
+            unique_key = f"star_{movie_id}_{i}_{context}"
+            if st.button("⭐" if i <= current_rating else "☆",
                         key=unique_key, 
                         help=f"Rate {i} stars"):
                 st.session_state.user_ratings[str(movie_id)] = i
@@ -444,7 +575,7 @@ def main():
         if st.button("Find Similar Movies", key="similar_search") and similar_movie:
             with st.spinner("Searching for similar movies..."):
                 recommendations = recommender.find_similar_movies(similar_movie)
-                st.session_state.recommendations = recommendations
+                set_recommendations(recommendations)
     
     with tab2:
         st.header("Discover Movies by Criteria")
@@ -491,13 +622,15 @@ def main():
         
         if st.button("Discover Movies", key="discover_search"):
             with st.spinner("Discovering movies..."):
+                min_rating = st.session_state.get('min_rating_slider', 0.0)
                 recommendations = recommender.discover_movies(
                     genres=selected_genres,
                     year=selected_year if selected_year != "Any" else None,
                     age_ratings=selected_ratings,  # FIXED: Now passes age ratings
-                    sort_by=sort_options[selected_sort]
+                    sort_by=sort_options[selected_sort],
+                    min_rating=min_rating
                 )
-                st.session_state.recommendations = recommendations
+                set_recommendations(recommendations, min_rating=min_rating)
     
     with tab3:
         st.header("AI-Powered Recommendations")
@@ -511,7 +644,7 @@ def main():
         if st.button("Get AI Recommendations", key="ai_search") and description:
             with st.spinner("AI is thinking..."):
                 recommendations = recommender.get_gemini_recommendations(description)
-                st.session_state.recommendations = recommendations
+                set_recommendations(recommendations)
     
     with tab4:
         st.header("❤️ My Favorite Movies")
@@ -544,7 +677,8 @@ def main():
                     col1, col2 = st.columns([1, 3])
                     
                     with col1:
-                        st.image(fav['poster_url'], width=150)
+                        poster = fetch_poster(fav['poster_url'])
+                        st.image(poster if poster else fav['poster_url'], width=150)
                     
                     with col2:
                         st.subheader(f"{fav['title']} ({fav['year']})")
@@ -585,30 +719,47 @@ def main():
         with filter_col2:
             max_results = st.selectbox("Maximum Results", [10, 20, 50, 100], index=1, key="max_results_select")
         
-        # FIXED: Apply filters to create filtered_recommendations
-        filtered_recommendations = []
-        for movie in st.session_state.recommendations:
-            if movie.get('vote_average', 0) >= min_rating:
-                filtered_recommendations.append(movie)
-        
-        # Limit results
-        filtered_recommendations = filtered_recommendations[:max_results]
-        
+        # FIXED: Apply filters with a vectorized DataFrame mask instead of a Python loop.
+        # Re-mask only when the slider is stricter than the threshold the
+        # results were already filtered to (e.g. server-side for discover).
+        rec_df = st.session_state.rec_df
+        if 'vote_average' in rec_df.columns and min_rating > st.session_state.rec_min_rating:
+            rec_df = rec_df[rec_df['vote_average'].fillna(0).ge(min_rating)]
+
+        # Limit results. Select the surviving rows back out of the original
+        # dicts - DataFrame records would turn missing keys into NaN and
+        # numpy scalars, which breaks rendering and favorites serialization.
+        filtered_recommendations = [st.session_state.recommendations[i]
+                                    for i in rec_df.head(max_results).index]
+        
+        # Only build cards for the visible window; "Show More" extends it, so
+        # the initial paint costs 10 cards instead of up to 100
+        visible_recommendations = filtered_recommendations[:st.session_state.card_window]
+
         if not filtered_recommendations:
             st.info("No movies match your filters. Try adjusting the criteria.")
         else:
-            st.write(f"Showing {len(filtered_recommendations)} movies:")
-            
+            st.write(f"Showing {len(visible_recommendations)} of {len(filtered_recommendations)} movies:")
+
+        # Build all cards concurrently before rendering so the page draws in ~1 RTT
+        # instead of one sequential details call per movie
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            movie_cards = list(executor.map(recommender.format_movie_card, visible_recommendations))
+        recommender.show_errors()
+
+        # Warm the poster cache concurrently so images don't download one by one
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(fetch_poster, [card['poster_url'] for card in movie_cards]))
+
         # Display movie cards with FIXED unique keys
-        for i, movie in enumerate(filtered_recommendations):
-            movie_card = recommender.format_movie_card(movie)
-            
+        for i, movie_card in enumerate(movie_cards):
             with st.container():
                 st.markdown('<div class="movie-card">', unsafe_allow_html=True)
                 col1, col2 = st.columns([1, 3])
                 
                 with col1:
-                    st.image(movie_card['poster_url'], width=200)
+                    poster = fetch_poster(movie_card['poster_url'])
+                    st.image(poster if poster else movie_card['poster_url'], width=200)
                 
                 with col2:
                     st.subheader(f"{movie_card['title']} ({movie_card['year']})")
@@ -663,9 +814,20 @@ def main():
                 st.markdown('</div>', unsafe_allow_html=True)
                 st.divider()
         
+        # Lazy-load the next batch of cards on demand
+        if len(filtered_recommendations) > st.session_state.card_window:
+            if st.button("⬇️ Show More", key="show_more_btn"):
+                st.session_state.card_window += 10
+                st.rerun()
+
         # Export recommendations - FIXED with unique key
         if st.button("📥 Export Recommendations", key="export_recommendations_btn"):
-            df = pd.DataFrame([recommender.format_movie_card(movie) for movie in filtered_recommendations])
+            # Export every filtered result, not just the visible window; cards
+            # already rendered come straight from the caches
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                export_cards = list(executor.map(recommender.format_movie_card, filtered_recommendations))
+            recommender.show_errors()
+            df = pd.DataFrame(export_cards)
             csv = df.to_csv(index=False)
             st.download_button(
                 label="Download as CSV",